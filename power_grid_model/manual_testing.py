@@ -7,13 +7,35 @@ This file contains all the helper functions for testing purpose
 """
 
 import json
+import math
+import mmap
+import os
+import stat
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Union
 
 import numpy as np
 
 from . import initialize_array
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+# invalid (NaN) value of integer data types
+_INT_NAN = {
+    np.dtype("i4"): int(np.iinfo("i4").min),
+    np.dtype("i1"): int(np.iinfo("i1").min),
+}
+# element-wise check of invalid (NaN) values per data type
+_NAN_FUNC = {
+    np.dtype("f8"): np.isnan,
+    **{dtype: partial(np.equal, nan_value) for dtype, nan_value in _INT_NAN.items()},
+}
+
 
 def is_nan(data) -> bool:
     """
@@ -25,12 +47,13 @@ def is_nan(data) -> bool:
         True if all the data points are invalid
         False otherwise
     """
-    nan_func = {
-        np.dtype("f8"): lambda x: np.all(np.isnan(x)),
-        np.dtype("i4"): lambda x: np.all(x == np.iinfo("i4").min),
-        np.dtype("i1"): lambda x: np.all(x == np.iinfo("i1").min),
-    }
-    return nan_func[data.dtype](data)
+    if data.ndim == 0:
+        # compare scalars in plain python, bypassing the ufunc machinery
+        if data.dtype in _INT_NAN:
+            return int(data) == _INT_NAN[data.dtype]
+        if data.dtype == np.dtype("f8"):
+            return math.isnan(data)
+    return bool(_NAN_FUNC[data.dtype](data).all())
 
 
 def convert_list_to_batch_data(
@@ -54,19 +77,20 @@ def convert_list_to_batch_data(
     for comp_type in all_types:
         # use 2D array if the type exists in all single dataset and the size is the same
         if np.all([comp_type in x for x in list_data]) and np.unique([x[comp_type].size for x in list_data]).size == 1:
-            batch_data[comp_type] = np.stack([x[comp_type] for x in list_data], axis=0)
+            first_data = list_data[0][comp_type]
+            stacked = np.empty((len(list_data), first_data.size), dtype=first_data.dtype)
+            for i, single_batch in enumerate(list_data):
+                stacked[i] = single_batch[comp_type]
+            batch_data[comp_type] = stacked
             continue
         # otherwise use indptr/data dict
-        indptr = [0]
-        data = []
-        for single_batch in list_data:
-            if comp_type not in single_batch:
-                indptr.append(indptr[-1])
-            else:
-                single_data = single_batch[comp_type]
-                indptr.append(indptr[-1] + single_data.shape[0])
-                data.append(single_data)
-        batch_data[comp_type] = {"indptr": np.array(indptr, dtype=np.int32), "data": np.concatenate(data, axis=0)}
+        parts = [x[comp_type] for x in list_data if comp_type in x]
+        sizes = np.fromiter(
+            (x[comp_type].shape[0] if comp_type in x else 0 for x in list_data), dtype=np.int32, count=len(list_data)
+        )
+        indptr = np.zeros(len(list_data) + 1, dtype=np.int32)
+        np.cumsum(sizes, out=indptr[1:])
+        batch_data[comp_type] = {"indptr": indptr, "data": np.concatenate(parts, axis=0)}
     return batch_data
 
 
@@ -84,20 +108,7 @@ def convert_python_to_numpy(
 
     """
     if isinstance(data, dict):
-        return_dict = {}
-        for component_name, component_list in data.items():
-            arr: np.ndarray = initialize_array(data_type, component_name, len(component_list))
-            for i, component in enumerate(component_list):
-                for property_name, value in component.items():
-                    if property_name not in arr[i].dtype.names:
-                        raise ValueError(f"Invalid property '{property_name}' for {component_name} {data_type} data.")
-                    try:
-                        arr[i][property_name] = value
-                    except ValueError as ex:
-                        raise ValueError(f"Invalid '{property_name}' value for {component_name} {data_type} data: {ex}")
-
-            return_dict[component_name] = arr
-        return return_dict
+        return _convert_python_to_numpy_single(data, data_type)
 
     if isinstance(data, list):
         list_data = [convert_python_to_numpy(json_dict, data_type=data_type) for json_dict in data]
@@ -106,6 +117,77 @@ def convert_python_to_numpy(
     raise TypeError("Only list or dict is allowed in JSON data!")
 
 
+def _convert_python_to_numpy_single(data: Dict[str, List[Dict]], data_type: str) -> Dict[str, np.ndarray]:
+    """
+    Convert native python data of a single dataset to internal numpy
+    If all objects of a component have the same attributes, the values are assigned per attribute column,
+    otherwise they are assigned per object.
+    Args:
+        data: data in dict
+        data_type: type of data: input, update, sym_output, or asym_output
+
+    Returns:
+        A single dataset for power-grid-model
+    """
+    dataset = {}
+    for component, objects in data.items():
+        arr: np.ndarray = initialize_array(data_type, component, len(objects))
+        # field views of the array, looked up once per component
+        columns = {name: arr[name] for name in arr.dtype.names}
+        key_sets = {frozenset(obj.keys()) for obj in objects}
+        if len(key_sets) == 1:
+            # homogeneous objects, assign each attribute as a whole column
+            for property_name in objects[0]:
+                if property_name not in columns:
+                    raise ValueError(f"Invalid property '{property_name}' for {component} {data_type} data.")
+                column = columns[property_name]
+                values = _as_column_values(column, [obj[property_name] for obj in objects])
+                if values is not None:
+                    column[:] = values
+                    continue
+                # ragged or invalid values, assign per object
+                for i, obj in enumerate(objects):
+                    try:
+                        column[i] = obj[property_name]
+                    except ValueError as ex:
+                        raise ValueError(f"Invalid '{property_name}' value for {component} {data_type} data: {ex}")
+        else:
+            for i, obj in enumerate(objects):
+                for property_name, value in obj.items():
+                    if property_name not in columns:
+                        raise ValueError(f"Invalid property '{property_name}' for {component} {data_type} data.")
+                    try:
+                        columns[property_name][i] = value
+                    except ValueError as ex:
+                        raise ValueError(f"Invalid '{property_name}' value for {component} {data_type} data: {ex}")
+
+        dataset[component] = arr
+    return dataset
+
+
+def _as_column_values(column: np.ndarray, values: List) -> Optional[np.ndarray]:
+    """
+    Convert the values of one attribute for all objects, such that they can be assigned to the column at once
+    Args:
+        column: a (N, ...) numpy array of one attribute for N objects
+        values: list of N values
+
+    Returns:
+        The values as a numpy array which matches the column per object
+        None if the values can only be assigned per object
+    """
+    try:
+        array = np.asarray(values, dtype=column.dtype)
+    except ValueError:
+        return None
+    if array.shape == column.shape:
+        return array
+    if array.shape == column.shape[:1]:
+        # one scalar per object for a multi-phase attribute, broadcast it over the phases of that object
+        return array.reshape(column.shape[:1] + (1,) * (column.ndim - 1))
+    return None
+
+
 def convert_batch_to_list_data(
     batch_data: Dict[str, Union[np.ndarray, Dict[str, np.ndarray]]]
 ) -> List[Dict[str, np.ndarray]]:
@@ -155,14 +237,80 @@ def convert_numpy_to_python(data: Dict[str, Union[np.ndarray, Dict[str, np.ndarr
         one_data = next(iter(data.values()))
         # it is batch dataset if it is 2D array of a dict of indptr/data
         if isinstance(one_data, dict) or one_data.ndim == 2:
-            list_data = convert_batch_to_list_data(data)
-            return [convert_numpy_to_python(x) for x in list_data]
+            return _convert_numpy_to_python_batch(data)
     # otherwise it is single dataset
     single_dataset: Dict[str, np.ndarray] = data
-    return {
-        name: [{k: item[k].tolist() for k in array.dtype.names if not is_nan(item[k])} for item in array]
-        for name, array in single_dataset.items()
-    }
+    return _convert_numpy_to_python_single(single_dataset)
+
+
+def _valid_mask(column: np.ndarray) -> np.ndarray:
+    """
+    Determine per object if the attribute is valid
+    Args:
+        column: a (N, ...) numpy array of one attribute for N objects
+
+    Returns:
+        A boolean array of size N, False if all the data points of that object are invalid
+    """
+    mask = _NAN_FUNC[column.dtype](column)
+    # multi-phase attributes are only invalid if all phases are invalid
+    if mask.ndim > 1:
+        mask = mask.all(axis=tuple(range(1, mask.ndim)))
+    # invert in place, no extra boolean array per attribute
+    return np.logical_not(mask, out=mask)
+
+
+def _convert_array_to_python(array: np.ndarray) -> List[Dict]:
+    """
+    Convert a 1D array of one component to native python data
+    The values and invalid (NaN) values are converted once per attribute column, instead of once per object.
+    Args:
+        array: A 1D numpy array of one component
+    Returns:
+        A json list of objects
+    """
+    # (name, values, valid) per attribute, all as python lists
+    columns = [(name, array[name].tolist(), _valid_mask(array[name]).tolist()) for name in array.dtype.names]
+    return [{name: values[i] for name, values, valid in columns if valid[i]} for i in range(array.shape[0])]
+
+
+def _convert_numpy_to_python_single(data: Dict[str, np.ndarray]) -> Dict[str, List[Dict]]:
+    """
+    Convert a single dataset of internal numpy arrays to native python data
+    Args:
+        data: A single dataset for power-grid-model
+    Returns:
+        A json dict for single dataset
+    """
+    return {component: _convert_array_to_python(array) for component, array in data.items()}
+
+
+def _convert_numpy_to_python_batch(
+    data: Dict[str, Union[np.ndarray, Dict[str, np.ndarray]]]
+) -> List[Dict[str, List[Dict]]]:
+    """
+    Convert a batch dataset of internal numpy arrays to native python data
+    Each component is converted for all batches at once, and then split per batch,
+    instead of splitting the arrays per batch first.
+    Args:
+        data: A batch dataset for power-grid-model
+    Returns:
+        A json list for batch dataset
+    """
+    one_data = next(iter(data.values()))
+    n_batch = one_data["indptr"].size - 1 if isinstance(one_data, dict) else one_data.shape[0]
+    list_data: List[Dict[str, List[Dict]]] = [{} for _ in range(n_batch)]
+    for component, batch in data.items():
+        if isinstance(batch, dict):
+            objects = _convert_array_to_python(batch["data"])
+            indptr = batch["indptr"].tolist()
+        else:
+            # a dense batch is converted as one flat array, which is a view for a contiguous 2D array
+            objects = _convert_array_to_python(batch.reshape(-1))
+            indptr = list(range(0, batch.size + 1, batch.shape[1])) if batch.shape[1] else [0] * (n_batch + 1)
+        for i, single_dataset in enumerate(list_data):
+            single_dataset[component] = objects[indptr[i] : indptr[i + 1]]
+    return list_data
 
 
 def import_json_data(json_file: Path, data_type: str) -> Union[Dict[str, np.ndarray], List[Dict[str, np.ndarray]]]:
@@ -176,11 +324,37 @@ def import_json_data(json_file: Path, data_type: str) -> Union[Dict[str, np.ndar
     Returns:
          A single or batch dataset for power-grid-model
     """
-    with open(json_file, mode="r", encoding="utf-8") as file_pointer:
-        json_data = json.load(file_pointer)
+    with open(json_file, mode="rb") as file_pointer:
+        file_stat = os.fstat(file_pointer.fileno())
+        if not stat.S_ISREG(file_stat.st_mode) or file_stat.st_size == 0:
+            # empty files, pipes and devices cannot be memory-mapped, read them as a whole
+            json_data = _loads_json(file_pointer.read())
+        else:
+            # memory-map the file, so orjson parses it without reading it into a bytes copy first
+            with mmap.mmap(file_pointer.fileno(), 0, access=mmap.ACCESS_READ) as json_map:
+                with memoryview(json_map) as json_view:
+                    json_data = _loads_json(json_view)
     return convert_python_to_numpy(json_data, data_type)
 
 
+def _loads_json(json_view: Union[bytes, memoryview]) -> Union[Dict, List]:
+    """
+    Parse json data, using orjson if it is installed
+    Args:
+        json_view: utf-8 encoded json data
+
+    Returns:
+        native python data
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(json_view)
+        except orjson.JSONDecodeError:
+            # orjson is strict, e.g. it rejects NaN literals, fall back to the standard library
+            pass
+    return json.loads(bytes(json_view))
+
+
 def export_json_data(json_file: Path, data: Union[Dict[str, np.ndarray], List[Dict[str, np.ndarray]]], indent=2):
     """
     export json data
@@ -194,5 +368,7 @@ def export_json_data(json_file: Path, data: Union[Dict[str, np.ndarray], List[Di
         Save to file
     """
     json_data = convert_numpy_to_python(data)
+    # serialize in memory and write once, json.dump writes every small chunk to the file separately
+    json_str = json.dumps(json_data, indent=indent)
     with open(json_file, mode="w", encoding="utf-8") as file_pointer:
-        json.dump(json_data, file_pointer, indent=indent)
+        file_pointer.write(json_str)
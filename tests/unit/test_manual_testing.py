@@ -2,16 +2,20 @@
 #
 # SPDX-License-Identifier: MPL-2.0
 
+import os
+import threading
 from pathlib import Path
 from unittest.mock import patch, mock_open, MagicMock
 
 import numpy as np
 import pytest
+from power_grid_model import initialize_array
 from power_grid_model.manual_testing import (
     convert_batch_to_list_data,
     convert_numpy_to_python,
     convert_python_to_numpy,
     export_json_data,
+    import_json_data,
     is_nan,
 )
 
@@ -81,6 +85,10 @@ def test_is_nan():
     assert not is_nan(array_i1)
     nan_array = np.array([np.nan, np.nan, np.nan])
     assert is_nan(nan_array)
+    assert is_nan(np.float64(np.nan))
+    assert not is_nan(np.float64(0.1))
+    assert is_nan(np.int32(-(2 ** 31)))
+    assert not is_nan(np.int8(1))
 
 
 def test_convert_json_to_numpy(two_nodes_one_line, two_nodes_two_lines):
@@ -124,11 +132,89 @@ def test_convert_batch_to_list_data__zero_batches():
     assert convert_batch_to_list_data({}) == []
 
 
-@patch("json.dump")
+@patch("json.dumps")
 @patch("builtins.open", new_callable=mock_open)
 @patch("power_grid_model.manual_testing.convert_numpy_to_python")
-def test_export_json_data(convert_mock: MagicMock, open_mock: MagicMock, json_dump_mock: MagicMock):
+def test_export_json_data(convert_mock: MagicMock, open_mock: MagicMock, json_dumps_mock: MagicMock):
     convert_mock.return_value = {"foo": [{"val": 123}]}
+    json_dumps_mock.return_value = '{"foo": [{"val": 123}]}'
     export_json_data(json_file=Path("output.json"), data={}, indent=2)
     convert_mock.assert_called_once()
-    json_dump_mock.assert_called_once_with({"foo": [{"val": 123}]}, open_mock(), indent=2)
+    json_dumps_mock.assert_called_once_with({"foo": [{"val": 123}]}, indent=2)
+    open_mock().write.assert_called_once_with('{"foo": [{"val": 123}]}')
+
+
+def test_convert_numpy_to_python__asym_nan():
+    asym_load = initialize_array("update", "asym_load", 2)
+    asym_load["id"] = [1, 2]
+    asym_load["p_specified"] = [[1.0, np.nan, 3.0], [np.nan, np.nan, np.nan]]
+    json_dict = convert_numpy_to_python({"asym_load": asym_load})
+    assert json_dict["asym_load"][0]["id"] == 1
+    assert np.allclose(json_dict["asym_load"][0]["p_specified"], [1.0, np.nan, 3.0], equal_nan=True)
+    assert json_dict["asym_load"][1] == {"id": 2}
+
+
+def test_convert_python_to_numpy__heterogeneous_objects():
+    pgm_data = convert_python_to_numpy({"node": [{"id": 11, "u_rated": 10.5e3}, {"id": 12}]}, "input")
+    assert pgm_data["node"]["id"].tolist() == [11, 12]
+    assert pgm_data["node"][0]["u_rated"] == 10.5e3
+    assert np.isnan(pgm_data["node"][1]["u_rated"])
+    with pytest.raises(ValueError, match="Invalid property 'u' for node input data."):
+        convert_python_to_numpy({"node": [{"id": 11}, {"id": 12, "u": 10.5e3}]}, "input")
+    with pytest.raises(ValueError, match="Invalid 'u_rated' value for node input data."):
+        convert_python_to_numpy({"node": [{"id": 11}, {"id": 12, "u_rated": "high"}]}, "input")
+
+
+def test_import_json_data(tmp_path: Path):
+    json_file = tmp_path / "input.json"
+    json_file.write_text('{"node": [{"id": 11, "u_rated": 10.5e3}]}', encoding="utf-8")
+    pgm_data = import_json_data(json_file, "input")
+    assert pgm_data["node"][0]["id"] == 11
+    assert pgm_data["node"][0]["u_rated"] == 10.5e3
+
+    # NaN literals are not standard json, but they are accepted
+    json_file.write_text('{"node": [{"id": 11, "u_rated": NaN}]}', encoding="utf-8")
+    pgm_data = import_json_data(json_file, "input")
+    assert np.isnan(pgm_data["node"][0]["u_rated"])
+
+    json_file.write_text("", encoding="utf-8")
+    with pytest.raises(ValueError):
+        import_json_data(json_file, "input")
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="named pipes are not available")
+def test_import_json_data__pipe(tmp_path: Path):
+    json_pipe = tmp_path / "input.json"
+    os.mkfifo(json_pipe)
+    writer = threading.Thread(target=json_pipe.write_text, args=('{"node": [{"id": 11, "u_rated": 10.5e3}]}',))
+    writer.start()
+    pgm_data = import_json_data(json_pipe, "input")
+    writer.join()
+    assert pgm_data["node"][0]["id"] == 11
+
+
+def test_convert_numpy_to_python__batch_with_empty_component(two_nodes_one_line, two_nodes_two_lines):
+    no_lines = {"node": two_nodes_one_line["node"], "line": []}
+    json_list = [two_nodes_two_lines, no_lines, two_nodes_one_line]
+    pgm_data_batch = convert_python_to_numpy(json_list, "input")
+    assert np.allclose(pgm_data_batch["line"]["indptr"], [0, 2, 2, 3])
+    assert convert_numpy_to_python(pgm_data_batch) == json_list
+
+
+def test_convert_python_to_numpy__asym_values():
+    # one scalar per object is applied to all phases
+    scalar_data = {"asym_load": [{"id": i, "p_specified": 10.0 * i} for i in range(1, 4)]}
+    pgm_data = convert_python_to_numpy(scalar_data, "update")
+    assert pgm_data["asym_load"]["p_specified"].tolist() == [[10.0] * 3, [20.0] * 3, [30.0] * 3]
+
+    scalar_data = {"asym_load": [{"id": i, "p_specified": 10.0 * i} for i in range(1, 3)]}
+    pgm_data = convert_python_to_numpy(scalar_data, "update")
+    assert pgm_data["asym_load"]["p_specified"].tolist() == [[10.0] * 3, [20.0] * 3]
+
+    # a mix of scalars and per-phase values
+    mixed_data = {"asym_load": [{"id": 1, "p_specified": 10.0}, {"id": 2, "p_specified": [1.0, 2.0, 3.0]}]}
+    pgm_data = convert_python_to_numpy(mixed_data, "update")
+    assert pgm_data["asym_load"]["p_specified"].tolist() == [[10.0] * 3, [1.0, 2.0, 3.0]]
+
+    with pytest.raises(ValueError, match="Invalid 'p_specified' value for asym_load update data."):
+        convert_python_to_numpy({"asym_load": [{"id": 1, "p_specified": [1.0, 2.0]}]}, "update")